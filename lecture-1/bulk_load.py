@@ -0,0 +1,287 @@
+import sqlite3
+import csv
+import json
+import os
+import sys
+import time
+import random
+import tempfile
+import argparse
+from itertools import islice
+
+# --- テーブル定義 ---
+# 列の順番はJSON/CSVから読み込むときの順番にもなる。typesは読み込み時の型変換に使う
+TABLES = {
+    "repos": {
+        "columns": ["name", "language", "stars"],
+        "types": [str, str, int],
+        "create": "CREATE TABLE IF NOT EXISTS repos (name TEXT, language TEXT, stars INTEGER)",
+        "indexes": [
+            # 言語ごとのスター数上位N件を、索引をたどるだけで取り出せるようにする
+            "CREATE INDEX IF NOT EXISTS idx_repos_language_stars ON repos(language, stars DESC, name)",
+            "CREATE INDEX IF NOT EXISTS idx_repos_stars ON repos(stars DESC)",
+            "CREATE INDEX IF NOT EXISTS idx_repos_name ON repos(name)",
+        ],
+    },
+    "cars": {
+        "columns": ["id", "name", "price"],
+        "types": [int, str, float],
+        "create": "CREATE TABLE IF NOT EXISTS cars (id INT, name TEXT, price REAL)",
+        "indexes": [
+            "CREATE INDEX IF NOT EXISTS idx_cars_price ON cars(price DESC)",
+            "CREATE INDEX IF NOT EXISTS idx_cars_name ON cars(name)",
+        ],
+    },
+}
+
+CHUNK_SIZE = 50000
+
+# どのロードでも使う設定
+PRAGMAS = [
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA cache_size = -200000",  # 約200MB
+]
+
+# テーブルがまだ無いときだけ使う設定（途中で落ちたらロードをやり直す前提で、安全性より速度を優先）
+# 既存のテーブルへの追記や--replaceでは、落ちたときにDBファイル全体が壊れないよう使わない
+UNSAFE_PRAGMAS = [
+    "PRAGMA journal_mode = MEMORY",
+    "PRAGMA synchronous = OFF",
+]
+
+
+# --- 入力ファイルの読み込み（1行ずつ流す） ---
+def convert(value, type_):
+    """空欄はNULLに、それ以外は列の型に変換する（変換できなければValueError）"""
+    if value is None:
+        return None
+    if isinstance(value, str):
+        value = value.strip()
+        if value == "":
+            return None
+    return type_(value)
+
+
+def read_rows(file_path, table):
+    """CSV / JSON Lines / JSON配列から、テーブルの列順・型にそろえたタプルを1件ずつ返す"""
+    columns = TABLES[table]["columns"]
+    types = TABLES[table]["types"]
+
+    def to_row(record, position):
+        if not isinstance(record, dict):
+            raise ValueError(f"{file_path} の{position}件目がオブジェクトではありません: {record!r}")
+        try:
+            return tuple(convert(record.get(col), type_) for col, type_ in zip(columns, types))
+        except (TypeError, ValueError) as e:
+            raise ValueError(f"{file_path} の{position}件目を変換できません: {e}") from e
+
+    ext = os.path.splitext(file_path)[1].lower()
+    with open(file_path, encoding="utf-8", newline="") as f:
+        if ext == ".csv":
+            reader = csv.DictReader(f)
+            missing = [col for col in columns if col not in (reader.fieldnames or [])]
+            if missing:
+                raise ValueError(f"{file_path} のヘッダーに列がありません: {', '.join(missing)}")
+            for i, record in enumerate(reader, start=1):
+                yield to_row(record, i)
+        elif ext in (".jsonl", ".ndjson"):
+            i = 0
+            for line in f:
+                if line.strip():
+                    i += 1
+                    yield to_row(json.loads(line), i)
+        elif ext == ".json":
+            # JSON配列は標準ライブラリでは逐次パースできないので一度に読む（大きいデータは.jsonlを推奨）
+            records = json.load(f)
+            if not isinstance(records, list):
+                raise ValueError(f"{file_path} はJSON配列ではありません")
+            for i, record in enumerate(records, start=1):
+                yield to_row(record, i)
+        else:
+            raise ValueError(f"対応していない形式です: {file_path}")
+
+
+def chunked(rows, size):
+    rows = iter(rows)
+    while True:
+        chunk = list(islice(rows, size))
+        if not chunk:
+            return
+        yield chunk
+
+
+# --- 一括ロード ---
+def bulk_load(db_path, table, rows, chunk_size=CHUNK_SIZE, replace=False):
+    """
+    rowsをchunk_size件ずつexecutemanyで挿入する。
+    全体を1つのトランザクションにまとめ、索引はロード後にまとめて作る。
+    テーブルがまだ無いときだけ、ジャーナルと同期を切って速度を優先する。
+    戻り値は挿入した件数。
+    """
+    schema = TABLES[table]
+    placeholders = ", ".join("?" for _ in schema["columns"])
+    sql = f"INSERT INTO {table} ({', '.join(schema['columns'])}) VALUES ({placeholders})"
+
+    conn = sqlite3.connect(db_path, isolation_level=None)
+    try:
+        cur = conn.cursor()
+        exists = cur.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (table,)).fetchone() is not None
+        pragmas = PRAGMAS + (UNSAFE_PRAGMAS if not exists else [])
+        for pragma in pragmas:
+            cur.execute(pragma)
+
+        cur.execute("BEGIN")
+        if replace:
+            cur.execute(f"DROP TABLE IF EXISTS {table}")
+        cur.execute(schema["create"])
+
+        count = 0
+        for chunk in chunked(rows, chunk_size):
+            cur.executemany(sql, chunk)
+            count += len(chunk)
+
+        for index_sql in schema["indexes"]:
+            cur.execute(index_sql)
+        cur.execute("COMMIT")
+        cur.execute("ANALYZE")
+        return count
+
+    except BaseException:
+        if conn.in_transaction:
+            conn.execute("ROLLBACK")
+        raise
+
+    finally:
+        conn.close()
+
+
+def ensure_indexes(conn, table):
+    """既存のDB（google_repos.db / car.dbなど）に索引を後から付ける"""
+    for index_sql in TABLES[table]["indexes"]:
+        conn.execute(index_sql)
+    conn.commit()
+
+
+# --- 索引を使う検索 ---
+def top_repos(conn, n=10, language=None):
+    """スター数上位N件。languageを指定するとその言語の中での上位N件（スター数が空の行は除く）"""
+    if language is None:
+        sql = "SELECT name, language, stars FROM repos WHERE stars IS NOT NULL ORDER BY stars DESC LIMIT ?"
+        return conn.execute(sql, (n,)).fetchall()
+    sql = "SELECT name, language, stars FROM repos WHERE language = ? AND stars IS NOT NULL ORDER BY stars DESC LIMIT ?"
+    return conn.execute(sql, (language, n)).fetchall()
+
+
+def top_repos_per_language(conn, n=3):
+    """
+    言語ごとのスター数上位N件を {言語: [(name, stars), ...]} で返す。
+    全件に窓関数をかけるのではなく、言語ごとに (language, stars) 索引をLIMIT付きでたどる。
+    """
+    languages = [row[0] for row in conn.execute("SELECT DISTINCT language FROM repos ORDER BY language")]
+    sql = "SELECT name, stars FROM repos WHERE language IS ? AND stars IS NOT NULL ORDER BY stars DESC LIMIT ?"
+    return {language: conn.execute(sql, (language, n)).fetchall() for language in languages}
+
+
+def find_repo(conn, name):
+    return conn.execute("SELECT name, language, stars FROM repos WHERE name = ?", (name,)).fetchall()
+
+
+def most_expensive_cars(conn, n=10):
+    return conn.execute("SELECT id, name, price FROM cars ORDER BY price DESC LIMIT ?", (n,)).fetchall()
+
+
+# --- ベンチマーク ---
+LANGUAGES = ["Python", "Go", "C++", "Java", "Kotlin", "TypeScript", "JavaScript", "Rust",
+             "Shell", "Swift", "Dart", "C", "Starlark", "Jupyter Notebook", None]
+
+
+def synthetic_repos(n, seed=0):
+    rng = random.Random(seed)
+    for i in range(n):
+        yield (f"repo-{i}", rng.choice(LANGUAGES), int(rng.paretovariate(1.2) * 10))
+
+
+def time_query(func, *args, repeat=20):
+    """repeat回実行したときの1回あたりの平均時間（ミリ秒）"""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        func(*args)
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def benchmark(n_rows=1_000_000, chunk_size=CHUNK_SIZE):
+    with tempfile.TemporaryDirectory() as tmp:
+        db_path = os.path.join(tmp, "bench_repos.db")
+
+        start = time.perf_counter()
+        count = bulk_load(db_path, "repos", synthetic_repos(n_rows), chunk_size)
+        elapsed = time.perf_counter() - start
+        print(f"ロード: {count:,}件 / {elapsed:.2f}秒 ({count / elapsed:,.0f} rows/s)")
+
+        conn = sqlite3.connect(db_path)
+        try:
+            print(f"上位10件（全体）          : {time_query(top_repos, conn, 10):8.3f} ms")
+            print(f"上位10件（Python）        : {time_query(top_repos, conn, 10, 'Python'):8.3f} ms")
+            print(f"言語ごとの上位3件         : {time_query(top_repos_per_language, conn, 3):8.3f} ms")
+            print(f"名前で1件検索             : {time_query(find_repo, conn, f'repo-{n_rows // 2}'):8.3f} ms")
+        finally:
+            conn.close()
+
+
+# --- コマンドライン ---
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="SQLiteへの一括ロードと索引付き検索")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    load = sub.add_parser("load", help="CSV / JSON Lines / JSONからテーブルへ一括ロードする")
+    load.add_argument("file")
+    load.add_argument("--db", required=True)
+    load.add_argument("--table", default="repos", choices=sorted(TABLES))
+    load.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    load.add_argument("--replace", action="store_true", help="既存のテーブルを作り直す")
+
+    top = sub.add_parser("top", help="言語ごとのスター数上位N件を表示する")
+    top.add_argument("--db", required=True)
+    top.add_argument("-n", type=int, default=3)
+    top.add_argument("--language")
+
+    bench = sub.add_parser("bench", help="合成データでロード速度と検索時間を測る")
+    bench.add_argument("--rows", type=int, default=1_000_000)
+    bench.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+
+    args = parser.parse_args(argv)
+
+    try:
+        if args.command == "load":
+            start = time.perf_counter()
+            count = bulk_load(args.db, args.table, read_rows(args.file, args.table), args.chunk_size, args.replace)
+            elapsed = time.perf_counter() - start
+            print(f"{count:,}件を{args.table}にロードしました（{elapsed:.2f}秒）")
+
+        elif args.command == "top":
+            conn = sqlite3.connect(args.db)
+            try:
+                ensure_indexes(conn, "repos")
+                if args.language:
+                    for name, language, stars in top_repos(conn, args.n, args.language):
+                        print(f"{stars:>8,}  {name}")
+                else:
+                    for language, repos in top_repos_per_language(conn, args.n).items():
+                        print(f"[{language}]")
+                        for name, stars in repos:
+                            print(f"  {stars:>8,}  {name}")
+            finally:
+                conn.close()
+
+        elif args.command == "bench":
+            benchmark(args.rows, args.chunk_size)
+
+    except (sqlite3.Error, OSError, ValueError) as e:
+        print('エラーが発生しました:', e)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,84 @@
+"""
+最終課題.ipynb のグラフ描画部分。
+バッチモードでは別プロセス（spawn）から呼ぶため、ノートブックではなくこのモジュールに置く。
+"""
+import os
+import matplotlib
+from matplotlib.figure import Figure
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+import seaborn as sns
+
+LINE_COLORS = {
+    "池上線": "#FE7FA7",
+    "東急多摩川線": "#AE0378"
+}
+
+def setup_style():
+    sns.set(style="whitegrid")
+    matplotlib.rcParams['font.family'] = 'sans-serif'
+    matplotlib.rcParams['font.sans-serif'] = ['Meiryo', 'Yu Gothic', 'Hiragino Sans', 'TakaoPGothic', 'Noto Sans CJK JP']
+
+def draw_station_counts(ax, counts):
+    # 1. 駅数比較
+    sns.barplot(data=counts, x='line_name', y='station_count', ax=ax, palette=LINE_COLORS)
+    ax.set_title("① 駅数の比較（規模）", fontsize=12)
+
+def draw_mean_transfers(ax, transfers):
+    # 2. 接続数比較
+    sns.barplot(data=transfers, x='line_name', y='transfer_count', ax=ax, palette=LINE_COLORS, errorbar=None)
+    ax.set_title("② 平均接続路線数（ハブ機能）", fontsize=12)
+
+def draw_intervals(ax, intervals):
+    # 3. 駅間距離分布
+    sns.boxplot(data=intervals, x='line_name', y='interval_km', ax=ax, palette=LINE_COLORS)
+    sns.swarmplot(data=intervals, x='line_name', y='interval_km', ax=ax, color=".3")
+    ax.set_title("③ 駅間距離の分布（バス感覚）", fontsize=12)
+
+def draw_ward_pie(ax, line, ward_counts):
+    # 4. 所在地構成（円グラフ）
+    if not ward_counts.empty:
+        ax.pie(ward_counts['station_count'], labels=ward_counts['ward'], autopct='%1.0f%%', 
+               colors=sns.color_palette("pastel"), textprops={'fontsize': 9})
+        ax.set_title(f"④ {line}の区構成", fontsize=10, color=LINE_COLORS.get(line, "black"), fontweight='bold')
+
+def draw_mean_ridership(ax, ridership):
+    # 5. 平均乗降人員比較
+    sns.barplot(data=ridership, x='line_name', y='ridership', ax=ax, palette=LINE_COLORS, errorbar=None)
+    ax.set_title("⑤ 1駅あたりの平均乗降人員（路線の実力）", fontsize=14, fontweight='bold')
+    ax.set_ylabel("人/日")
+    
+    for p in ax.patches:
+        height = p.get_height()
+        if height > 0:
+            ax.annotate(f'{int(height):,}人', (p.get_x() + p.get_width() / 2., height), ha = 'center', va = 'center', xytext = (0, 10), textcoords = 'offset points')
+
+PANEL_DRAWERS = {
+    "station_counts": draw_station_counts,
+    "mean_transfers": draw_mean_transfers,
+    "intervals": draw_intervals,
+    "mean_ridership": draw_mean_ridership,
+}
+
+def render_panel_file(name, data, path):
+    """
+    1パネルを画像ファイルに書き出す（ワーカープロセスからも呼ばれる）。
+    pyplotを通さずAggのキャンバスに直接描くので、呼び出し元のバックエンドは変わらない。
+    """
+    setup_style()
+    if name == "ward_composition":
+        lines = list(dict.fromkeys(data['line_name']))
+        n = max(len(lines), 1)
+        fig = Figure(figsize=(5 * n, 5))
+        axes = fig.subplots(1, n, squeeze=False)
+        for ax, line in zip(axes[0], lines):
+            draw_ward_pie(ax, line, data[data['line_name'] == line])
+    else:
+        fig = Figure(figsize=(7, 5))
+        PANEL_DRAWERS[name](fig.subplots(), data)
+    FigureCanvasAgg(fig)
+    fig.tight_layout()
+    # 途中で落ちても壊れた画像がキャッシュとして残らないよう一時ファイル経由で保存
+    tmp_path = path + ".tmp"
+    fig.savefig(tmp_path, format="png", dpi=150)
+    os.replace(tmp_path, path)
+    return path
@@ -2,6 +2,55 @@ import flet as ft
 import requests
 import sqlite3
 import datetime
+import time
+import numpy as np
+import pandas as pd
+
+# --- 天気の分類（判定の優先順は 雪 > 雷 > 雨 > 晴 > 曇） ---
+def classify_weather(weather_text):
+    """天気の文章を1つのカテゴリにまとめる"""
+    text = weather_text or ""
+    if "雪" in text:
+        return "雪"
+    elif "雷" in text:
+        return "雷"
+    elif "雨" in text:
+        return "雨"
+    elif "晴" in text:
+        return "晴"
+    elif "曇" in text or "くもり" in text:
+        return "曇"
+    else:
+        return "不明"
+
+def summarize_weather(db_name, regions=None):
+    """
+    weather_forecastsの全行から、日ごと・地方ごとに雨/雪が予想される詳細地域の数を集計する。
+    天気の文章は種類が少ないので、重複を除いた文字列だけを調べてから配列の添字で全行に展開する。
+    「雨か雪」のように両方を含む予報は、雨・雪の両方に数える（表示用のclassify_weatherとは別に判定する）。
+    regions: 地域名(area_name) → 地方名 の対応表
+    """
+    conn = sqlite3.connect(db_name)
+    df = pd.read_sql_query("SELECT area_name, sub_area, date, weather FROM weather_forecasts", conn)
+    conn.close()
+
+    if df.empty:
+        return None, None
+
+    # 文字列をカテゴリ型にして、ユニークな天気だけ「雨」「雪」を含むか調べる
+    weather = df["weather"].astype("category")
+    codes = weather.cat.codes.to_numpy()
+    has_rain = np.array(["雨" in w for w in weather.cat.categories], dtype=bool)
+    has_snow = np.array(["雪" in w for w in weather.cat.categories], dtype=bool)
+
+    df["rain"] = has_rain[codes]
+    df["snow"] = has_snow[codes]
+    df["region"] = df["area_name"].map(regions or {}).fillna("不明")
+
+    by_date = df.groupby("date")[["rain", "snow"]].sum().astype(int)
+    by_date["total"] = df.groupby("date").size()
+    by_region = df.groupby(["region", "date"])[["rain", "snow"]].sum().astype(int)
+    return by_date, by_region
 
 def main(page: ft.Page):
     # --- ページの設定 ---
@@ -40,20 +89,17 @@ def main(page: ft.Page):
     init_db()
 
     # --- ヘルパー関数: 天気の文字からアイコンと色を決める ---
+    WEATHER_STYLES = {
+        "雪": (ft.Icons.AC_UNIT, ft.Colors.CYAN, ft.Colors.CYAN_50),
+        "雷": (ft.Icons.THUNDERSTORM, ft.Colors.YELLOW_900, ft.Colors.YELLOW_50),
+        "雨": (ft.Icons.WATER_DROP, ft.Colors.BLUE, ft.Colors.BLUE_50),
+        "晴": (ft.Icons.WB_SUNNY, ft.Colors.ORANGE, ft.Colors.ORANGE_50),
+        "曇": (ft.Icons.CLOUD, ft.Colors.BLUE_GREY, ft.Colors.BLUE_GREY_50),
+        "不明": (ft.Icons.QUESTION_MARK, ft.Colors.BLACK, ft.Colors.WHITE),
+    }
+
     def get_weather_style(weather_text):
-        text = weather_text or ""
-        if "雪" in text:
-            return ft.Icons.AC_UNIT, ft.Colors.CYAN, ft.Colors.CYAN_50
-        elif "雷" in text:
-            return ft.Icons.THUNDERSTORM, ft.Colors.YELLOW_900, ft.Colors.YELLOW_50
-        elif "雨" in text:
-            return ft.Icons.WATER_DROP, ft.Colors.BLUE, ft.Colors.BLUE_50
-        elif "晴" in text:
-            return ft.Icons.WB_SUNNY, ft.Colors.ORANGE, ft.Colors.ORANGE_50
-        elif "曇" in text or "くもり" in text:
-            return ft.Icons.CLOUD, ft.Colors.BLUE_GREY, ft.Colors.BLUE_GREY_50
-        else:
-            return ft.Icons.QUESTION_MARK, ft.Colors.BLACK, ft.Colors.WHITE
+        return WEATHER_STYLES[classify_weather(weather_text)]
 
     # --- UIパーツの準備 ---
     weather_display_column = ft.Column(scroll=ft.ScrollMode.AUTO)
@@ -160,8 +206,8 @@ def main(page: ft.Page):
                 weathers = area["weathers"]
                 
                 # 2. 取得したデータをDBへ保存 (ループ処理)
-                for time, weather in zip(times, weathers):
-                    date_str = time.split("T")[0]
+                for time_define, weather in zip(times, weathers):
+                    date_str = time_define.split("T")[0]
                     # ここで詳細地域名(sub_area_name)も一緒に保存
                     save_weather_to_db(area_name, sub_area_name, date_str, weather)
                 
@@ -240,8 +286,87 @@ def main(page: ft.Page):
         
         page.update()
 
-    # --- 初期データ取得とリスト作成 (変更なし) ---
+    # --- 全国サマリー（DBの全行から雨・雪の地域数を集計） ---
+    office_regions = {}  # 地域名 → 地方名（エリア一覧の読み込み時に作る）
+
+    def summary_card(label, value, color):
+        return ft.Container(
+            width=120,
+            padding=10,
+            border_radius=10,
+            bgcolor=ft.Colors.with_opacity(0.85, ft.Colors.WHITE),
+            content=ft.Column([
+                ft.Text(label, size=12, color=ft.Colors.GREY_600),
+                ft.Text(f"{value}地域", size=18, weight=ft.FontWeight.BOLD, color=color),
+            ], spacing=2)
+        )
+
+    def show_summary(e):
+        weather_display_column.controls.clear()
+        weather_display_column.controls.append(
+            ft.Text("全国サマリー", size=40, weight=ft.FontWeight.BOLD, color=ft.Colors.WHITE)
+        )
+        weather_display_column.controls.append(ft.Divider(color=ft.Colors.WHITE54))
+
+        try:
+            start = time.perf_counter()
+            by_date, by_region = summarize_weather(DB_NAME, office_regions)
+            elapsed_ms = (time.perf_counter() - start) * 1000
+
+            if by_date is None:
+                weather_display_column.controls.append(ft.Text("データが見つかりませんでした。", color=ft.Colors.RED_100))
+            else:
+                # 日ごとの雨・雪の地域数
+                for date_str, row in by_date.iterrows():
+                    weather_display_column.controls.append(
+                        ft.Row([
+                            ft.Text(date_str, size=16, weight=ft.FontWeight.BOLD, color=ft.Colors.BLUE_900, width=110),
+                            summary_card("☔ 雨", row["rain"], ft.Colors.BLUE),
+                            summary_card("❄️ 雪", row["snow"], ft.Colors.CYAN),
+                            summary_card("全体", row["total"], ft.Colors.BLACK87),
+                        ], wrap=True, spacing=15)
+                    )
+
+                # 地方ごとの内訳
+                for region, rows in by_region.groupby(level="region"):
+                    weather_display_column.controls.append(
+                        ft.Container(
+                            content=ft.Text(f"📍 {region}", size=18, weight=ft.FontWeight.BOLD, color=ft.Colors.BLUE_900),
+                            margin=ft.margin.only(top=20, bottom=5),
+                            padding=ft.padding.symmetric(horizontal=10, vertical=5),
+                            bgcolor=ft.Colors.WHITE70,
+                            border_radius=5
+                        )
+                    )
+                    for (_, date_str), row in rows.iterrows():
+                        weather_display_column.controls.append(
+                            ft.Text(f"{date_str}  雨 {row['rain']}地域 / 雪 {row['snow']}地域", size=14, color=ft.Colors.BLACK87)
+                        )
+
+                weather_display_column.controls.append(
+                    ft.Container(
+                        content=ft.Text(f"※データベース(SQLite)の全{int(by_date['total'].sum())}件から集計しました（{elapsed_ms:.1f} ms）", size=12, color=ft.Colors.WHITE70),
+                        margin=ft.margin.only(top=20)
+                    )
+                )
+
+        except Exception as err:
+            weather_display_column.controls.append(ft.Text(f"エラー: {err}", color=ft.Colors.RED_100))
+            print(f"Error: {err}")
+
+        page.update()
+
+    # --- 初期データ取得とリスト作成 ---
     area_list_view = ft.ListView(expand=True, spacing=0, padding=0)
+    area_list_view.controls.append(
+        ft.ListTile(
+            title=ft.Text("全国サマリー", weight=ft.FontWeight.BOLD, color=ft.Colors.BLUE_800),
+            leading=ft.Icon(ft.Icons.MAP, size=16, color=ft.Colors.BLUE_400),
+            on_click=show_summary,
+            dense=True,
+            hover_color=ft.Colors.BLUE_50,
+        )
+    )
 
     try:
         area_url = "http://www.jma.go.jp/bosai/common/const/area.json"
@@ -260,6 +385,7 @@ def main(page: ft.Page):
                     office_info = offices[code]
                     office_name = office_info["name"]
                     office_kana = office_info.get("kana", "")
+                    office_regions[office_name] = region_name
                     
                     tile = ft.ListTile(
                         title=ft.Text(office_name, weight=ft.FontWeight.W_500, color=ft.Colors.BLUE_GREY_900),